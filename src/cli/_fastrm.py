@@ -0,0 +1,96 @@
+"""
+src/cli/_fastrm.py
+快速删除目录树的辅助模块。
+对于包含大量文件的目录（例如 library/.meta），系统原生的删除命令
+比 shutil.rmtree 快得多；小目录则在进程内基于目录文件描述符删除。
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Union
+
+# 目录树中的条目数超过该阈值时，才调用系统原生删除命令
+NATIVE_RM_THRESHOLD = 500
+
+# cmd 会解释的特殊字符
+_CMD_METACHARS = frozenset('&|<>^%"')
+
+def _exceeds(path: Union[str, Path], limit: int) -> bool:
+    """
+    判断目录树中的条目数是否超过 limit。
+    一旦超过立即返回，不会遍历整棵树。
+    """
+    count = 0
+    for _, dirs, files in os.walk(path):
+        count += len(dirs) + len(files)
+        if count > limit:
+            return True
+    return False
+
+def _native_rmtree(path: Union[str, Path]) -> bool:
+    """
+    调用系统原生命令删除目录树。
+
+    Returns:
+        命令执行成功返回 True；没有可用的命令、路径无法安全地交给 cmd 或执行失败返回 False。
+    """
+    if sys.platform.startswith("win"):
+        # rd 是 cmd 的内置命令，只能通过 cmd /c 调用。即使以参数列表传入，
+        # cmd 仍会重新解析整条命令行：展开 %VAR%，并把 & | < > ^ 当作控制符。
+        # 路径来自 config.json 的 library_path，含这些字符时不交给 cmd，由调用方回退到进程内删除
+        if any(c in _CMD_METACHARS for c in str(path)):
+            return False
+        result = subprocess.run(["cmd", "/c", "rd", "/s", "/q", str(path)], check=False)
+    elif shutil.which("rm"):
+        result = subprocess.run(["rm", "-rf", "--", str(path)], check=False)
+    else:
+        return False
+    return result.returncode == 0
+
+def _fwalk_rmtree(path: Union[str, Path]) -> None:
+    """
+    自底向上遍历目录树，基于目录文件描述符逐个删除文件和空目录。
+    同一目录下的所有子项复用同一个 dir_fd，无需反复解析完整路径。
+    与 shutil.rmtree(ignore_errors=True) 一样忽略删除过程中的错误。
+    """
+    for _, dirs, files, rootfd in os.fwalk(path, topdown=False, follow_symlinks=False):
+        for name in files:
+            try:
+                os.unlink(name, dir_fd=rootfd)
+            except OSError:
+                pass
+        for name in dirs:
+            try:
+                os.rmdir(name, dir_fd=rootfd)
+            except NotADirectoryError:
+                # 指向目录的符号链接也会出现在 dirs 中，只删除链接本身
+                try:
+                    os.unlink(name, dir_fd=rootfd)
+                except OSError:
+                    pass
+            except OSError:
+                pass
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+def fast_rmtree(path: Union[str, Path]) -> None:
+    """
+    删除目录树，忽略删除过程中的错误（与 shutil.rmtree(ignore_errors=True) 一致）。
+    条目数超过 NATIVE_RM_THRESHOLD 时优先使用系统原生命令；
+    否则（或原生命令失败时）在支持 os.fwalk 的平台上使用 _fwalk_rmtree，
+    其他平台回退到 shutil.rmtree。
+
+    Args:
+        path: 要删除的目录。
+    """
+    if _exceeds(path, NATIVE_RM_THRESHOLD) and _native_rmtree(path):
+        return
+    if hasattr(os, "fwalk"):
+        _fwalk_rmtree(path)
+    else:
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,124 @@
+"""
+src/cli/_manifest.py
+命令清单缓存模块。
+将 "命令名称 -> 模块:类名" 的映射写入 ~/.passersbyc/commands.json，
+启动时只需导入本次要执行的命令所在的模块，无需扫描整个 commands 包。
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.cli.core import CLIApp
+import src.cli.commands
+
+# 命令清单文件的位置
+MANIFEST_PATH = Path.home() / ".passersbyc" / "commands.json"
+
+# 除命令模块外，同样会影响缓存的帮助文本的源文件（位于 src/cli 目录下）
+_CLI_DIR = Path(__file__).parent
+_HELP_SOURCES = ("core.py", "main.py")
+
+def _commands_key() -> str:
+    """
+    根据 commands 包中各模块文件的名称和修改时间计算缓存键。
+    新增、删除或修改命令模块后缓存键随之改变，旧清单自动失效。
+    目录本身的修改时间不参与计算，因为创建或清理 __pycache__ 也会改变它。
+    决定顶层帮助文本的 core.py（CLIApp）和 main.py（程序名称）也参与计算。
+    """
+    digest = hashlib.md5()
+    for name in _HELP_SOURCES:
+        digest.update(f"{name}:{os.stat(_CLI_DIR / name).st_mtime_ns}\n".encode())
+    for directory in src.cli.commands.__path__:
+        digest.update(f"{directory}\n".encode())
+        with os.scandir(directory) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.name.endswith(".py"):
+                    digest.update(f"{entry.name}:{entry.stat().st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def _read() -> Optional[dict]:
+    """
+    读取命令清单文件。
+
+    Returns:
+        清单内容；清单不存在、无法解析或已过期时返回 None。
+    """
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        if manifest.get("key") != _commands_key():
+            return None
+        return manifest
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def read_manifest() -> Optional[Dict[str, str]]:
+    """
+    读取命令清单。
+
+    Returns:
+        命令名称到 "模块:类名" 的映射；清单不存在、无法解析或已过期时返回 None。
+    """
+    manifest = _read()
+    return None if manifest is None else manifest.get("commands")
+
+def read_help() -> Optional[str]:
+    """
+    读取生成清单时一并保存的顶层帮助文本。
+
+    Returns:
+        帮助文本；清单不存在、无法解析或已过期时返回 None。
+    """
+    manifest = _read()
+    return None if manifest is None else manifest.get("help")
+
+def write_manifest(app: CLIApp) -> Path:
+    """
+    将 app 中已注册的所有命令及顶层帮助文本写入命令清单。
+
+    Args:
+        app: 已完成完整命令扫描的 CLIApp 实例。
+
+    Returns:
+        命令清单文件的路径。
+    """
+    commands = {
+        name: f"{cls.__module__}:{cls.__qualname__}"
+        for name, cls in app._command_classes.items()
+    }
+    app._add_all_subparsers()
+    manifest = {"key": _commands_key(), "commands": commands, "help": app.parser.format_help()}
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return MANIFEST_PATH
+
+def load_from_manifest(app: CLIApp, command: str) -> bool:
+    """
+    根据命令清单只导入并注册 command 对应的命令类。
+
+    Args:
+        app: CLIApp 实例。
+        command: 要执行的子命令名称。
+
+    Returns:
+        注册成功返回 True；清单缺失、过期或其中没有该命令时返回 False，
+        调用方应回退到完整扫描。
+    """
+    commands = read_manifest()
+    if not commands or command not in commands:
+        return False
+    import importlib
+    module_name, _, class_name = commands[command].partition(":")
+    try:
+        command_cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        return False
+    if getattr(command_cls, "name", None) != command:
+        return False
+    app.register_command(command_cls)
+    return True
@@ -0,0 +1,28 @@
+"""
+src/cli/commands/_validators.py
+命令之间共享的参数类型转换函数，供 argparse 的 type= 使用。
+"""
+
+import argparse
+from pathlib import Path
+
+def is_file(path_str: str) -> Path:
+    """
+    校验是否为存在的普通文件。
+    正常情况下只需 is_file() 的一次 stat 调用；
+    仅在校验失败时才再调用 exists() 来区分错误信息。
+    """
+    path = Path(path_str)
+    if not path.is_file():
+        if not path.exists():
+            raise argparse.ArgumentTypeError(f"文件 '{path_str}' 不存在")
+        raise argparse.ArgumentTypeError(f"'{path_str}' 不是一个有效的文件路径")
+    return path
+
+def parse_tags(tags_str: str) -> list:
+    """
+    解析逗号分隔的标签，去除空白和空标签。
+    """
+    if not tags_str:
+        return []
+    return [tag.strip() for tag in tags_str.split(',') if tag.strip()]
@@ -0,0 +1,37 @@
+"""
+src/cli/commands/build_manifest.py
+生成命令清单（~/.passersbyc/commands.json），加快之后每次启动时的命令加载。
+"""
+
+import argparse
+from src.cli.core import BaseCommand, CLIApp
+
+class BuildManifestCommand(BaseCommand):
+    """
+    生成命令清单命令实现类。
+    """
+
+    # 命令名称：build_manifest
+    name = "build_manifest"
+
+    # 命令描述：生成命令清单，加快启动速度。
+    description = "生成命令清单，加快启动速度。"
+
+    def configure_parser(self, parser: argparse.ArgumentParser) -> None:
+        """
+        该命令没有额外参数。
+        """
+        pass
+
+    def execute(self, args: argparse.Namespace) -> int:
+        """
+        完整扫描 commands 包并写入命令清单。
+        """
+        from src.cli.main import PROG_NAME, load_commands
+        from src.cli._manifest import write_manifest
+
+        app = CLIApp(prog_name=PROG_NAME)
+        load_commands(app)
+        manifest_path = write_manifest(app)
+        print(f"✅ 已写入命令清单 ({len(app._command_classes)} 个命令): {manifest_path}")
+        return 0
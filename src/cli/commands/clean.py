@@ -1,8 +1,49 @@
 import argparse
 from src.cli.core import BaseCommand
 from pathlib import Path
-import json
+import os
+import sys
 import shutil
+from src.cli._fastrm import fast_rmtree
+
+# 需要清理的缓存文件/目录：完整名称和文件后缀
+_CACHE_NAMES = {"__pycache__", ".DS_Store", ".pytest_cache"}
+_CACHE_SUFFIXES = (".pyc", ".pyo")
+
+def _walk(top: str):
+    """
+    自顶向下遍历目录树，产出 (root, dirs, files, rootfd)。
+    在支持 os.fwalk 的平台上 rootfd 为当前目录的文件描述符；
+    在 Windows 等不支持的平台上回退到 os.walk，此时 rootfd 为 None。
+    top 不存在或不是目录时不产出任何内容（os.fwalk 在这种情况下会抛出异常）。
+    """
+    if not os.path.isdir(top):
+        return
+    if hasattr(os, "fwalk"):
+        yield from os.fwalk(top)
+    else:
+        for root, dirs, files in os.walk(top):
+            yield root, dirs, files, None
+
+def _unlink_at(root: str, rootfd, name: str) -> None:
+    """
+    删除 root 目录下的文件 name。
+    有目录文件描述符时基于 dir_fd 删除，避免重新解析完整路径。
+    """
+    if rootfd is None:
+        os.unlink(os.path.join(root, name))
+    else:
+        os.unlink(name, dir_fd=rootfd)
+
+def _rmtree_at(root: str, rootfd, name: str) -> None:
+    """
+    删除 root 目录下的目录树 name。
+    shutil.rmtree 自 Python 3.11 起支持 dir_fd，更早的版本使用完整路径。
+    """
+    if rootfd is None or sys.version_info < (3, 11):
+        shutil.rmtree(os.path.join(root, name))
+    else:
+        shutil.rmtree(name, dir_fd=rootfd)
 
 class CleanCommand(BaseCommand):
     """
@@ -11,26 +52,12 @@ class CleanCommand(BaseCommand):
     def __init__(self) -> None:
         super().__init__()
         self.args = None  # 用于存储解析后的参数
-        from toolboxs import get_project_root
-        config_path = get_project_root() / "config.json"
-        if config_path.exists():
-            self.data = json.loads(config_path.read_text(encoding="utf-8"))
-        else:
-            self.data = {}
 
-    @property
-    def name(self) -> str:
-        """
-        命令名称：clean
-        """
-        return "clean"
+    # 命令名称：clean
+    name = "clean"
 
-    @property
-    def description(self) -> str:
-        """
-        命令描述：清理项目中的临时文件和缓存。
-        """
-        return "清理项目中的临时文件和缓存。"
+    # 命令描述：清理项目中的临时文件和缓存。
+    description = "清理项目中的临时文件和缓存。"
 
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """
@@ -69,6 +96,11 @@ class CleanCommand(BaseCommand):
             action="store_true",
             help="强制清理，不提示确认。"
         )
+        parser.add_argument(
+            "-v","--verbose",
+            action="store_true",
+            help="逐项显示被删除的文件和目录。"
+        )
 
     def execute(self, args: argparse.Namespace) -> int:
         """
@@ -113,7 +145,7 @@ class CleanCommand(BaseCommand):
         清理元数据文件夹。
         目标：删除 library/.meta 文件夹。
         """
-        library_path = self.data.get("project_settings", {}).get("library_path", "library")
+        library_path = self.config.get("project_settings", {}).get("library_path", "library")
         mate_path = Path(library_path) / ".meta"
         if not mate_path.is_absolute():
             from toolboxs import get_project_root
@@ -121,7 +153,7 @@ class CleanCommand(BaseCommand):
             
         if mate_path.exists():
             if self._confirm(f"❓ 确定要删除元数据文件夹 {mate_path} 吗?"):
-                shutil.rmtree(mate_path, ignore_errors=True)
+                fast_rmtree(mate_path)
                 print(f"✅ 已删除元数据文件夹: {mate_path}")
         else:
             print(f"✨ 元数据文件夹不存在: {mate_path}")
@@ -130,7 +162,7 @@ class CleanCommand(BaseCommand):
         """
         清理库目录。
         """
-        library_path_str = self.data.get("project_settings", {}).get("library_path", "library")
+        library_path_str = self.config.get("project_settings", {}).get("library_path", "library")
         library_path = Path(library_path_str)
         if not library_path.is_absolute():
             from toolboxs import get_project_root
@@ -141,16 +173,25 @@ class CleanCommand(BaseCommand):
             return
 
         if self._confirm(f"❓ 确定要清理库目录 {library_path} 中的所有子目录吗?"):
-            for item in library_path.iterdir():
-                if item.is_dir() and item.name != ".meta":
-                    shutil.rmtree(item, ignore_errors=True)
-                    print(f"🗑️  已删除目录: {item}")
+            # 逐项输出先收集起来，最后一次性写出
+            lines = []
+            count = 0
+            # os.scandir 的 DirEntry 缓存了目录项类型，is_dir() 通常无需额外的 stat 调用
+            with os.scandir(library_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and entry.name != ".meta":
+                        fast_rmtree(entry.path)
+                        count += 1
+                        if self.args.verbose:
+                            lines.append(f"🗑️  已删除目录: {entry.path}")
+            lines.append(f"✅ 已清理库目录中的 {count} 个子目录。")
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def _clean_csv(self, query: Path) -> None: 
         """
         清理生成的 CSV 清单文件。
         """
-        csv_path_str = self.data.get("project_settings", {}).get("csv_path", "library_manifest.csv")
+        csv_path_str = self.config.get("project_settings", {}).get("csv_path", "library_manifest.csv")
         csv_path = Path(csv_path_str)
         if not csv_path.is_absolute():
             from toolboxs import get_project_root
@@ -171,22 +212,39 @@ class CleanCommand(BaseCommand):
         targets = ["__pycache__", "*.pyc", "*.pyo", ".DS_Store", ".pytest_cache"]
         print(f"🔍 正在清理缓存文件 ({', '.join(targets)}) ...")
         
+        # 只遍历一次目录树，在循环内按名称匹配所有目标
+        # 逐项输出先收集起来，最后一次性写出
+        lines = []
         count = 0
-        for pattern in targets:
-            for item in query.rglob(pattern):
+        verbose = self.args.verbose
+        for root, dirs, files, rootfd in _walk(os.fspath(query)):
+            # 全程只使用目录项名称和目录文件描述符，完整路径仅在需要输出时才拼接
+            matched = [name for name in dirs if name in _CACHE_NAMES or name.endswith(_CACHE_SUFFIXES)]
+            for name in matched:
+                # 从 dirs 中移除，避免继续深入即将被删除的目录
+                dirs.remove(name)
                 try:
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
+                    _rmtree_at(root, rootfd, name)
                     count += 1
+                    if verbose:
+                        lines.append(f"🗑️  已删除: {os.path.join(root, name)}")
                 except Exception as e:
-                    print(f"⚠️  删除 {item} 失败: {e}")
+                    lines.append(f"⚠️  删除 {os.path.join(root, name)} 失败: {e}")
+            for name in files:
+                if name in _CACHE_NAMES or name.endswith(_CACHE_SUFFIXES):
+                    try:
+                        _unlink_at(root, rootfd, name)
+                        count += 1
+                        if verbose:
+                            lines.append(f"🗑️  已删除: {os.path.join(root, name)}")
+                    except Exception as e:
+                        lines.append(f"⚠️  删除 {os.path.join(root, name)} 失败: {e}")
         
         if count > 0:
-            print(f"✨ 已清理 {count} 个缓存文件/目录。")
+            lines.append(f"✨ 已清理 {count} 个缓存文件/目录。")
         else:
-            print("✨ 没有发现缓存文件。")
+            lines.append("✨ 没有发现缓存文件。")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _clean_all(self, query: Path) -> None:
         """
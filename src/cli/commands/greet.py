@@ -5,26 +5,18 @@ src/cli/commands/greet.py
 
 import argparse
 from src.cli.core import BaseCommand
-from pathlib import Path
+from src.cli.commands._validators import is_file, parse_tags
 
 class GreetCommand(BaseCommand):
     """
     打招呼命令实现类。
     """
     
-    @property
-    def name(self) -> str:
-        """
-        命令名称：greet
-        """
-        return "greet"
+    # 命令名称：greet
+    name = "greet"
 
-    @property
-    def description(self) -> str:
-        """
-        命令描述：向用户打招呼。
-        """
-        return "向用户打招呼。"
+    # 命令描述：向用户打招呼。
+    description = "向用户打招呼。"
 
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """
@@ -39,21 +31,6 @@ class GreetCommand(BaseCommand):
         - -n, --name: 要打招呼的对象名称（默认为 World）。
         - --loud: 是否大声打招呼（转换为全大写）。
         """
-        # 辅助函数：校验是否为存在的文件
-        def is_file(path_str):
-            path = Path(path_str)
-            if not path.exists():
-                 raise argparse.ArgumentTypeError(f"文件 '{path_str}' 不存在")
-            if not path.is_file():
-                raise argparse.ArgumentTypeError(f"'{path_str}' 不是一个有效的文件路径")
-            return path
-
-        # 辅助函数：解析逗号分隔的标签
-        def parse_tags(tags_str):
-            if not tags_str:
-                return []
-            return [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-
         # 位置参数：文件路径
         parser.add_argument(
             "file_path",
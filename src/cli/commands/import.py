@@ -2,51 +2,120 @@ import csv
 import argparse
 import shutil
 import json
+import os
 import time
 from pathlib import Path
 from src.cli.core import BaseCommand
-from toolboxs import determine_file_type, get_library_path, generate_file_md5, get_project_root,export_library_manifest
+from src.cli.commands._validators import is_file, parse_tags
+
+def _search_manifest(manifest_path: Path, needle):
+    """
+    在清单文件中按字节查找 needle，无需解析 CSV。
+    :param needle: 要查找的字节串
+    :return: 命中时返回所在行的文本；清单不存在、为空或未命中时返回 None
+    """
+    import mmap
+    try:
+        with open(manifest_path, 'rb') as f:
+            # 空文件无法 mmap，视为没有记录
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(needle)
+                if pos == -1:
+                    return None
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                line_end = mm.find(b"\n", pos)
+                if line_end == -1:
+                    line_end = len(mm)
+                return mm[line_start:line_end].decode("utf-8-sig")
+    except FileNotFoundError:
+        return None
 
 class ImportCommand(BaseCommand):
-    def _check_duplicate(self, file_md5: str) -> tuple[bool, str]:
+    def __init__(self) -> None:
+        super().__init__()
+        import threading
+        # 并行导入时保护元数据/清单写入和批次内查重
+        self._lock = threading.Lock()
+        # 本批次中已成功导入的文件：MD5 -> 文件名
+        self._batch_md5s = {}
+        # 本批次中正在导入的文件：MD5 -> 导入结束（无论成功与否）时触发的事件
+        self._pending_md5s = {}
+        # 本批次中已被占用的目标文件和元数据文件路径
+        self._batch_targets = set()
+
+    def _manifest_path(self) -> Path:
         """
-        检查文件是否已存在。
-        逻辑：扫描 library_manifest.csv 中的 MD5 列。
-        :return: (是否重复, 重复文件的原始名称)
+        获取清单文件路径（config.json 中的 project_settings.csv_path）。
         """
-        if not file_md5:
-            return False, ""
-            
+        from toolboxs import get_project_root
         root = get_project_root()
         # 尝试从 config.json 获取清单文件名
         manifest_name = "library_manifest.csv"
         try:
-            config_path = root / "config.json"
-            if config_path.exists():
-                config = json.loads(config_path.read_text(encoding="utf-8"))
-                manifest_name = config.get("project_settings", {}).get("csv_path", manifest_name)
+            manifest_name = self.config.get("project_settings", {}).get("csv_path", manifest_name)
         except Exception:
             pass
-            
-        manifest_path = root / manifest_name
-        if not manifest_path.exists():
+        return root / manifest_name
+
+    def _check_duplicate(self, file_md5: str) -> tuple[bool, str]:
+        """
+        检查文件是否已存在。
+        逻辑：在清单文件中直接搜索 ",<MD5>," 字节串（MD5 列两侧都有其他列），
+        只有命中时才解析所在的那一行来获取文件名，无需逐行解析整个 CSV。
+        :return: (是否重复, 重复文件的原始名称)
+        """
+        if not file_md5:
             return False, ""
             
+        needle = b"," + file_md5.encode("ascii") + b","
         try:
-            with open(manifest_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get("MD5") == file_md5:
-                        return True, row.get("文件名", "未知文件")
+            line = _search_manifest(self._manifest_path(), needle)
         except Exception as e:
             print(f"警告: 查重时读取清单失败: {e}")
+            return False, ""
+        if line is None:
+            return False, ""
             
-        return False, ""
+        row = next(csv.reader([line]), None)
+        return True, row[0] if row else "未知文件"
 
-    def _parse_tags(self, tags_str):
-        if not tags_str:
-            return []
-        return [tag.strip() for tag in tags_str.split(',') if tag.strip()]
+    def _manifest_sizes(self, sizes) -> set:
+        """
+        找出清单中已有记录的文件大小，用于预判文件是否可能已存在。
+        清单中没有相同大小的记录时，内容不可能重复，无需先计算 MD5 查重。
+        与 _check_duplicate 一样在 mmap 上按字节查找，不解析 CSV：
+        文件大小列紧挨在 MD5 列之前，用一个正则 ",(<大小1>|<大小2>|...),<32 位 MD5>,"
+        对整个清单只扫描一遍。
+        清单不存在、为空或读取失败时视为没有记录。
+        :param sizes: 要查找的文件大小
+        :return: sizes 中在清单里出现过的大小
+        """
+        sizes = set(sizes)
+        if not sizes:
+            return set()
+        import mmap
+        import re
+        pattern = re.compile(
+            b",(%s),[0-9a-f]{32}," % b"|".join(b"%d" % size for size in sorted(sizes))
+        )
+        found = set()
+        try:
+            with open(self._manifest_path(), 'rb') as f:
+                # 空文件无法 mmap，视为没有记录
+                if os.fstat(f.fileno()).st_size == 0:
+                    return found
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in pattern.finditer(mm):
+                        found.add(int(match.group(1)))
+                        if found == sizes:
+                            break
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"警告: 查重时读取清单失败: {e}")
+        return found
 
     def _determine_storage_path(self, base_path: Path, author: str, series: str) -> Path:
         """
@@ -70,40 +139,40 @@ class ImportCommand(BaseCommand):
         target_path.mkdir(parents=True, exist_ok=True)
         return target_path
 
-    @property
-    def name(self) -> str:
-        """
-        命令名称：import
-        """
-        return "import"
+    # 命令名称：import
+    name = "import"
 
-    @property
-    def description(self) -> str:
-        """
-        命令描述：从文件/文件夹导入数据。
-        """
-        return "导入资源"
+    # 命令描述：从文件/文件夹导入数据。
+    description = "导入资源"
 
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """
         配置 import 命令的参数。
         
         参数：
-        - file: 要导入的文件路径。
-        """
-        def is_file(path_str):
-            path = Path(path_str)
-            if not path.exists():
-                 raise argparse.ArgumentTypeError(f"文件 '{path_str}' 不存在")
-            if not path.is_file():
-                raise argparse.ArgumentTypeError(f"'{path_str}' 不是一个有效的文件路径")
-            return path
-            
-        parser.add_argument("file", type=is_file, help="传入要导入的文件路径")
+        - file: 要导入的文件路径，可以传入多个。
+        """
+        parser.add_argument("file", type=is_file, nargs="+", help="传入要导入的文件路径（可传入多个）")
         parser.add_argument("--author","-a", type=str, help="指定 资源的作者")
         parser.add_argument("--series","-s", type=str, help="指定 资源的系列")
         parser.add_argument("--tags","-t", type=str, help="指定 资源的标签，多个标签用逗号分隔")
         parser.add_argument("--source","-o", type=str, help="指定 资源的来源")
+        parser.add_argument("--hardlink", action="store_true", help="源文件与书库在同一文件系统时创建硬链接而不是复制（修改源文件会同时影响书库中的文件）")
+
+    def _copy_file(self, source: Path, target: Path, hardlink: bool) -> None:
+        """
+        将文件复制到书库。
+        指定 hardlink 且源文件与目标目录位于同一设备时，创建硬链接（不复制任何数据）；
+        否则（或创建硬链接失败时）使用 shutil.copy2 复制。
+        """
+        if hardlink:
+            try:
+                if source.stat().st_dev == target.parent.stat().st_dev:
+                    os.link(source, target)
+                    return
+            except OSError:
+                pass
+        shutil.copy2(source, target)
 
     def _supplement_csv(self, metadata: dict):
         """
@@ -113,13 +182,10 @@ class ImportCommand(BaseCommand):
         2. 如果文件存在，补充刚导入的 JSON 数据。
         3. 如果不存在，运行 export_library_manifest() 导出清单文件。
         """
+        from toolboxs import get_project_root, export_library_manifest, manifest_row, MANIFEST_HEADERS
         try:
             root = get_project_root()
-            config_path = root / "config.json"
-            manifest_name = "library_manifest.csv"
-            if config_path.exists():
-                data = json.loads(config_path.read_text(encoding="utf-8"))
-                manifest_name = data.get("project_settings", {}).get("csv_path", manifest_name)
+            manifest_name = self.config.get("project_settings", {}).get("csv_path", "library_manifest.csv")
         except Exception as e:
             print(f"❌ 读取配置文件失败: {e}")
             return
@@ -133,36 +199,16 @@ class ImportCommand(BaseCommand):
 
         # 如果文件存在，则追加新记录
         try:
-            headers = [
-                "文件名", "作者", "系列", "标签", "来源", 
-                "后缀", "分类", "导入时间", "文件大小(Bytes)", "MD5", "文件路径"
-            ]
-            
-            # 准备要写入的数据行
-            tags = metadata.get("tags", [])
-            tags_str = ",".join(tags) if isinstance(tags, list) else str(tags)
-            
-            row_dict = {
-                "文件名": metadata.get("original_filename", ""),
-                "作者": metadata.get("author", ""),
-                "系列": metadata.get("series", ""),
-                "标签": tags_str,
-                "来源": metadata.get("source", ""),
-                "后缀": metadata.get("file_type", ""),
-                "分类": metadata.get("type", ""),
-                "导入时间": metadata.get("import_time", ""),
-                "文件大小(Bytes)": metadata.get("file_size", 0),
-                "MD5": metadata.get("md5", ""),
-                "文件路径": metadata.get("file_path", "")
-            }
+            # 准备要写入的数据行：与导出清单使用同一个行构造函数，列顺序与 MANIFEST_HEADERS 一致
+            row = manifest_row(metadata)
             
-            # 以追加模式打开 CSV
+            # 以追加模式打开 CSV，列是固定的，直接用 csv.writer 按位置写入
             with open(csv_path, 'a', encoding='utf-8-sig', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
+                writer = csv.writer(f)
                 # 如果文件是空的（理论上不会，因为 exists 检查过了，但以防万一），写表头
                 if f.tell() == 0:
-                    writer.writeheader()
-                writer.writerow(row_dict)
+                    writer.writerow(MANIFEST_HEADERS)
+                writer.writerow(row)
             print(f"✅ 清单文件已更新: {csv_path}")
             
         except Exception as e:
@@ -172,14 +218,15 @@ class ImportCommand(BaseCommand):
         """
         生成元数据 JSON 文件
         """
+        from toolboxs import determine_file_type, get_project_root
         metadata = {
             "original_filename": source_file.name,
             "author": args.author if args.author else None,
             "series": args.series if args.series else None,
-            "tags": self._parse_tags(args.tags) if args.tags else [],
+            "tags": parse_tags(args.tags) if args.tags else [],
             "source": args.source if args.source else None,
             "file_type": source_file.suffix[1:],
-            "type": determine_file_type(str(source_file)),
+            "type": determine_file_type(str(source_file), self.config),
             "import_time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
             "file_size": target_file.stat().st_size if target_file.exists() else 0,
             "md5": file_md5,
@@ -199,53 +246,163 @@ class ImportCommand(BaseCommand):
     def execute(self, args: argparse.Namespace) -> int:
         """
         执行导入命令。
+        传入多个文件时，使用线程池并行导入（MD5 计算和文件复制都是 I/O 密集型操作）。
         :param args: 解析后的命令行参数。
-        :return: 整数退出码，0 表示成功，非 0 表示失败。
+        :return: 整数退出码，0 表示全部成功，非 0 表示有文件导入失败。
         """
-        # 1. 计算文件 MD5 并进行查重
-        print(f"正在扫描文件: {args.file.name}...")
-        file_md5 = generate_file_md5(args.file)
-        is_dup, dup_name = self._check_duplicate(file_md5)
+        from collections import Counter
+        files = args.file
+        self._batch_md5s = {}
+        self._pending_md5s = {}
+        self._batch_targets = set()
         
-        if is_dup:
-            print(f"⚠️  文件已存在 (MD5 命中): {args.file.name}")
-            print(f"   库中已有同内容文件: {dup_name}")
-            print("   导入已取消。")
-            return 0  # 正常退出，但未执行导入
+        # 预先判断每个文件是否需要先计算 MD5 查重：
+        # 本批次中有其他相同大小的文件，或清单中有相同大小的记录（整个清单只扫描一遍）
+        sizes = [f.stat().st_size for f in files]
+        batch_sizes = Counter(sizes)
+        known_sizes = self._manifest_sizes(size for size in batch_sizes if batch_sizes[size] == 1)
+        may_dup = [batch_sizes[size] > 1 or size in known_sizes for size in sizes]
+        
+        if len(files) == 1:
+            return self._import_one(files[0], args, may_dup[0])
             
-        # 2. 识别文件类型
-        file_type = determine_file_type(str(args.file))
+        import itertools
+        from concurrent.futures import ThreadPoolExecutor
+        max_workers = min(8, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._import_one, files, itertools.repeat(args), may_dup))
+        return max(results)
+
+    def _import_one(self, file: Path, args: argparse.Namespace, may_dup: bool) -> int:
+        """
+        导入单个文件。
+        :param file: 要导入的文件路径。
+        :param args: 解析后的命令行参数（作者、系列、标签等）。
+        :param may_dup: 是否可能与已有文件重复；为 True 时先计算 MD5 查重。
+        :return: 0 表示成功（或因重复而跳过），1 表示失败。
+        """
+        # 延迟导入：仅在真正执行导入时才加载 toolboxs
+        from toolboxs import determine_file_type, generate_file_md5
+        print(f"正在扫描文件: {file.name}...")
+        
+        # 1. 识别文件类型：无法识别的文件无需计算 MD5
+        file_type = determine_file_type(str(file), self.config)
         if file_type == "unknown":
-            print(f"无法识别文件类型: {args.file}")
+            print(f"无法识别文件类型: {file}")
             return 1
-        type_path=get_library_path() / file_type
-        json_path=get_library_path() / ".meta" / file_type
+            
+        # 2. 查重：仅当可能重复时，才需要先计算 MD5
+        file_md5 = None
+        claimed = False
+        if may_dup:
+            file_md5 = generate_file_md5(file)
+            is_dup, dup_name = self._check_duplicate(file_md5)
+            if not is_dup and file_md5:
+                is_dup, dup_name, claimed = self._claim_md5(file_md5)
+            
+            if is_dup:
+                # 并行导入时多次 print 会与其他线程的输出交错，整条消息一次输出
+                print(f"⚠️  文件已存在 (MD5 命中): {file.name}\n"
+                      f"   库中已有同内容文件: {dup_name}\n"
+                      "   导入已取消。")
+                return 0  # 正常退出，但未执行导入
+        
+        succeeded = False
+        try:
+            succeeded = self._import_file(file, args, file_type, file_md5)
+        finally:
+            if claimed:
+                self._release_md5(file_md5, file.name, succeeded)
+        return 0 if succeeded else 1
+
+    def _claim_md5(self, file_md5: str) -> tuple[bool, str, bool]:
+        """
+        在本批次内登记即将导入的 MD5。
+        同一 MD5 已有文件正在导入时，等待其结束：成功则视为重复，失败则由当前文件接替导入。
+        :return: (是否重复, 重复文件的原始名称, 是否已登记；登记后必须调用 _release_md5)
+        """
+        while True:
+            with self._lock:
+                if file_md5 in self._batch_md5s:
+                    return True, self._batch_md5s[file_md5], False
+                event = self._pending_md5s.get(file_md5)
+                if event is None:
+                    import threading
+                    self._pending_md5s[file_md5] = threading.Event()
+                    return False, "", True
+            event.wait()
+
+    def _release_md5(self, file_md5: str, name: str, succeeded: bool) -> None:
+        """
+        结束 _claim_md5 的登记：仅在导入成功时记录该 MD5，并唤醒等待同一 MD5 的线程。
+        """
+        with self._lock:
+            if succeeded:
+                self._batch_md5s[file_md5] = name
+            self._pending_md5s.pop(file_md5).set()
+
+    def _claim_targets(self, *paths: Path) -> bool:
+        """
+        在本批次内占用目标文件和元数据文件路径（占用后直到本批次结束才释放）。
+        :return: 所有路径均未被其他文件占用时返回 True。
+        """
+        keys = {os.path.normcase(os.fspath(path)) for path in paths}
+        with self._lock:
+            if not keys.isdisjoint(self._batch_targets):
+                return False
+            self._batch_targets.update(keys)
+            return True
+
+    def _import_file(self, file: Path, args: argparse.Namespace, file_type: str, file_md5) -> bool:
+        """
+        将文件复制到书库，并生成元数据、更新清单。
+        :param file_md5: 已计算的 MD5；为 None 时与文件复制并行计算。
+        :return: 文件复制和元数据写入均成功时返回 True。
+        """
+        from toolboxs import get_library_path, generate_file_md5
+        library_path = get_library_path()
+        type_path = library_path / file_type
+        json_path = library_path / ".meta" / file_type
         
         # 使用封装的函数计算并创建存储路径
         current_path = self._determine_storage_path(type_path, args.author, args.series)
         json_folder = self._determine_storage_path(json_path, args.author, args.series)
         
         # 构建 JSON 文件路径 (与源文件同名，但后缀为 .json)
-        json_file_path = json_folder / (args.file.stem + ".json")
+        json_file_path = json_folder / (file.stem + ".json")
         
         # 构建目标文件路径
-        target_path = current_path / args.file.name
+        target_path = current_path / file.name
+        
+        # 同一批次中不同文件可能同名（例如 a/book.txt 与 b/book.txt），
+        # 它们会写入同一个目标文件和元数据文件：只有先占用路径的文件会被导入
+        if not self._claim_targets(target_path, json_file_path):
+            print(f"❌ 导入失败: 目标路径 {target_path} 与本批次中的其他文件冲突: {file}")
+            return False
         
         try:
-            shutil.copy2(args.file, target_path)
+            if file_md5 is None:
+                from concurrent.futures import ThreadPoolExecutor
+                # 元数据仍需要 MD5：与文件复制并行计算，而不是在复制前串行计算
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    md5_future = executor.submit(generate_file_md5, file)
+                    self._copy_file(file, target_path, args.hardlink)
+                    file_md5 = md5_future.result()
+            else:
+                self._copy_file(file, target_path, args.hardlink)
             print(f"✅ 文件已导入: {target_path}")
             
-            # 生成元数据 JSON
-            metadata = self._create_metadata_json(json_file_path, args, args.file, target_path, file_md5)
-            if metadata:
-                print(f"✅ json文件已导入: {json_file_path}")
-                # 补充到 CSV 清单
-                self._supplement_csv(metadata)
+            # 元数据和清单的写入需要串行：
+            # 清单不存在时会根据已有的元数据重新导出，不能与其他线程的写入交错
+            with self._lock:
+                # 生成元数据 JSON
+                metadata = self._create_metadata_json(json_file_path, args, file, target_path, file_md5)
+                if metadata:
+                    print(f"✅ json文件已导入: {json_file_path}")
+                    # 补充到 CSV 清单
+                    self._supplement_csv(metadata)
         except Exception as e:
             print(f"❌ 导入失败: {e}")
-            return 1
+            return False
             
-        return 0
-
-
-
+        return metadata is not None
@@ -1,27 +1,18 @@
 import argparse
-import json
 from pathlib import Path
 from src.cli.core import BaseCommand
-from toolboxs import get_library_path, export_library_manifest, get_project_root
 
 class ManifestCommand(BaseCommand):
     """
     导出书库清单命令实现类。
     """
     
-    @property
-    def name(self) -> str:
-        """
-        命令名称
-        """
-        return "manifest"
+    # 命令名称
+    name = "manifest"
+
+    # 命令描述
+    description = "导出书库清单"
 
-    @property
-    def description(self) -> str:
-        """
-        命令描述
-        """
-        return "导出书库清单"
         
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """
@@ -30,10 +21,7 @@ class ManifestCommand(BaseCommand):
         # 尝试从 config.json 获取默认路径
         default_csv = "library_manifest.csv"
         try:
-            config_path = get_project_root() / "config.json"
-            if config_path.exists():
-                config = json.loads(config_path.read_text(encoding="utf-8"))
-                default_csv = config.get("project_settings", {}).get("csv_path", default_csv)
+            default_csv = self.config.get("project_settings", {}).get("csv_path", default_csv)
         except Exception:
             pass
 
@@ -49,11 +37,12 @@ class ManifestCommand(BaseCommand):
         """
         执行命令。
         """
+        from toolboxs import export_library_manifest
         output_path = Path(args.output)
         if not output_path.is_absolute():
             if not Path(output_path).exists():
 
-                result = export_library_manifest(args.output)
+                result = export_library_manifest(args.output, self.config)
         
                 if result.startswith("错误"):
                     print(f"❌ {result}")
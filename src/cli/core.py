@@ -8,15 +8,17 @@ import abc
 from typing import Dict, Type, List, Optional
 import sys
 import shlex
-from toolboxs import translate_error
 
 class ArgumentParserError(Exception):
     """
     自定义异常类，用于捕获 ArgumentParser 的错误。
     默认的 argparse 会在出错时调用 sys.exit()，
     在交互模式下，我们希望捕获错误并继续运行，而不是直接退出程序。
+    status 为 argparse 原本要使用的退出码（例如 --help 为 0）。
     """
-    pass
+    def __init__(self, message: str, status: int = 2):
+        super().__init__(message)
+        self.status = status
 
 class NoExitArgumentParser(argparse.ArgumentParser):
     """
@@ -32,7 +34,7 @@ class NoExitArgumentParser(argparse.ArgumentParser):
         """当调用 --help 或解析错误需要退出时调用。"""
         if message:
             print(message, file=sys.stderr)
-        raise ArgumentParserError(f"Exited with status {status}")
+        raise ArgumentParserError(f"Exited with status {status}", status)
 
 class BaseCommand(abc.ABC):
     """
@@ -40,22 +42,27 @@ class BaseCommand(abc.ABC):
     每个具体的命令都需要继承此类并实现其抽象方法。
     """
     
-    @property
-    @abc.abstractmethod
-    def name(self) -> str:
-        """
-        命令的名称，用于在命令行中调用该命令。
-        例如，如果 name 返回 "greet"，则可通过 `mycli greet` 调用。
-        """
-        pass
+    #: 命令的名称，用于在命令行中调用该命令。
+    #: 例如，如果 name 为 "greet"，则可通过 `mycli greet` 调用。
+    #: 以类属性的形式声明，注册命令时无需创建实例即可读取。
+    name: str = ""
+
+    #: 命令的描述信息，显示在帮助文本中。
+    description: str = ""
+
+    #: 命令所属的 CLIApp 实例，由 CLIApp 在实例化命令时设置。
+    app: Optional["CLIApp"] = None
 
     @property
-    @abc.abstractmethod
-    def description(self) -> str:
+    def config(self) -> dict:
         """
-        命令的描述信息，显示在帮助文本中。
+        config.json 中的配置内容。
+        优先使用 CLIApp 读取的配置；未设置时（例如单独创建的 CLIApp）回退到 load_config()。
         """
-        pass
+        if self.app is not None and self.app.config is not None:
+            return self.app.config
+        from toolboxs import load_config
+        return load_config()
 
     @abc.abstractmethod
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
@@ -81,6 +88,60 @@ class BaseCommand(abc.ABC):
         """
         pass
 
+def _build_trie(words: List[str]) -> dict:
+    """
+    为补全候选词构建前缀树。
+    每个节点是 {字符: 子节点} 的字典，键 '' 保存在该节点结束的完整单词。
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = word
+    return trie
+
+def _iter_trie(trie: dict, prefix: str):
+    """
+    按插入顺序产出前缀树中所有以 prefix 开头的单词。
+    只访问 prefix 对应的子树，开销与匹配数量成正比，而与候选总数无关。
+    """
+    node = trie
+    for ch in prefix:
+        node = node.get(ch)
+        if node is None:
+            return
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if '' in node:
+            yield node['']
+        # 逆序压栈，使出栈顺序与插入顺序一致
+        stack.extend(child for ch, child in reversed(node.items()) if ch)
+
+# shlex 只把空格、制表符和换行当作分隔符；str.split() 还会在全角空格、
+# 不换行空格等 Unicode 空白处分割，因此快速路径先把制表符和换行替换成空格，再只按空格分割
+_SHLEX_WHITESPACE = str.maketrans("\t\r\n", "   ")
+
+def _split_input(user_input: str) -> List[str]:
+    """
+    将交互模式下输入的一行命令分割为参数列表，规则与 shlex.split 相同。
+    """
+    # 快速路径：不含引号和反斜杠的输入，按空白分割即可得到与 shlex 相同的结果
+    if not any(c in user_input for c in ('"', "'", "\\")):
+        return [arg for arg in user_input.translate(_SHLEX_WHITESPACE).split(" ") if arg]
+    # 使用 shlex.split 模拟 shell 的参数分割规则，支持引号包含的参数
+    # 在 Windows 上 shlex 默认按 POSIX 规则处理（反斜杠是转义符），导致路径 E:\path 被错误解析
+    # 因此需指定 posix=False 以支持 Windows 风格路径（反斜杠仅作为分隔符）
+    # 注意：posix=False 会保留引号，所以我们需要手动处理引号去除
+    is_windows = sys.platform.startswith('win')
+    argv = shlex.split(user_input, posix=not is_windows)
+    
+    # 如果是 Windows 模式，shlex 不会自动去除引号，我们需要手动去除
+    if is_windows:
+        argv = [arg.strip('"\'') for arg in argv]
+    return argv
+
 class CLIApp:
     """
     CLI 应用的主类，负责管理所有已注册的命令。
@@ -101,31 +162,94 @@ class CLIApp:
         
         # 添加子命令解析器容器
         self.subparsers = self.parser.add_subparsers(title="所有命令", dest="command", required=True)
-        # 存储已注册的命令实例
+        # 存储已注册的命令类（注册时不实例化，避免为未使用的命令付出初始化开销）
+        self._command_classes: Dict[str, Type[BaseCommand]] = {}
+        # 存储已实例化的命令（仅在命令真正被调用时创建）
         self._commands: Dict[str, BaseCommand] = {}
+        # 交互模式下各命令的参数补全前缀树（按需构建）
+        self._completion_cache: Dict[str, dict] = {}
+        # 交互模式下缓存的顶层帮助文本，注册新命令时失效
+        self._cached_help: Optional[str] = None
+        # config.json 的内容，由 main() 在启动时设置、交互模式下每条命令前刷新，供各命令共享
+        self.config: Optional[dict] = None
 
     def register_command(self, command_cls: Type[BaseCommand]) -> None:
         """
         注册一个新的命令类。
+        命令的名称和描述直接从类属性读取，此时既不会创建命令实例，
+        也不会构建子解析器；子解析器在命令首次被调用时才按需构建。
         
         Args:
             command_cls: 继承自 BaseCommand 的命令类。
         """
-        command = command_cls()
-        if command.name in self._commands:
-            raise ValueError(f"Command '{command.name}' is already registered.")
-        
-        self._commands[command.name] = command
+        name = command_cls.name
+        if not name:
+            raise ValueError(f"Command class '{command_cls.__name__}' does not define a name.")
+        if name in self._command_classes:
+            raise ValueError(f"Command '{name}' is already registered.")
         
-        # 为新命令添加子解析器
-        cmd_parser = self.subparsers.add_parser(
-            command.name, 
-            help=command.description,
-            description=command.description
-        )
+        self._command_classes[name] = command_cls
+        self._cached_help = None
+
+    def _add_subparser(self, name: str) -> argparse.ArgumentParser:
+        """
+        为命令添加仅包含名称和描述的子解析器（不配置参数）。
+        如果该子解析器已存在，则直接返回。
+        """
+        cmd_parser = self.subparsers.choices.get(name)
+        if cmd_parser is None:
+            command_cls = self._command_classes[name]
+            cmd_parser = self.subparsers.add_parser(
+                name, 
+                help=command_cls.description,
+                description=command_cls.description
+            )
+        return cmd_parser
+
+    def _build_parser(self, name: str) -> argparse.ArgumentParser:
+        """
+        构建指定命令的完整子解析器，并缓存命令实例。
+        同一命令只会实例化并配置一次，交互模式下后续调用直接复用。
+        """
+        cmd_parser = self._add_subparser(name)
+        if name not in self._commands:
+            command = self._command_classes[name]()
+            command.app = self
+            # 调用命令类自己的配置方法来定义参数
+            command.configure_parser(cmd_parser)
+            self._commands[name] = command
+        return cmd_parser
+
+    def _add_all_subparsers(self) -> None:
+        """
+        为所有已注册的命令添加名称和描述，用于顶层帮助信息和错误提示。
+        """
+        for name in self._command_classes:
+            self._add_subparser(name)
+
+    def _sniff_subcommand(self, argv: List[str]) -> Optional[str]:
+        """
+        在不解析参数的情况下，从 argv 中找出要执行的子命令名称。
+        顶层解析器只有选项参数，因此第一个非选项参数即为子命令。
         
-        # 调用命令类自己的配置方法来定义参数
-        command.configure_parser(cmd_parser)
+        Returns:
+            已注册的子命令名称；若未找到或未注册，返回 None。
+        """
+        for arg in argv:
+            if arg.startswith('-'):
+                continue
+            return arg if arg in self._command_classes else None
+        return None
+
+    def refresh_config(self) -> None:
+        """
+        重新读取 config.json 到 self.config；读取失败时保留原有配置。
+        """
+        from toolboxs import load_config
+        try:
+            self.config = load_config()
+        except Exception as e:
+            print(f"警告: 无法读取配置文件: {e}", file=sys.stderr)
 
     def run_interactive(self) -> int:
         """
@@ -145,25 +269,32 @@ class CLIApp:
             class CLICompleter(Completer):
                 """
                 自定义补全器，支持命令和参数的上下文感知补全。
+                命令名称和参数选项都保存在前缀树中；
+                命令的参数选项在首次需要补全时才提取，并缓存在 CLIApp 中。
                 """
                 def __init__(self, app):
                     self.app = app
-                    self.command_options = {}
-                    self._init_options()
-                
-                def _init_options(self):
-                    # 提取每个子命令的参数选项
-                    if self.app.subparsers and hasattr(self.app.subparsers, 'choices'):
-                        for cmd_name, parser in self.app.subparsers.choices.items():
-                            opts = []
-                            for action in parser._actions:
-                                opts.extend(action.option_strings)
-                            self.command_options[cmd_name] = opts
-                    
-                    # 添加内置命令（无参数）
+                    # 可补全的命令名称：已注册的命令 + 内置命令（无参数）
+                    command_names = list(self.app._command_classes)
                     for cmd in ['exit', 'help', '?']:
-                        if cmd not in self.command_options:
-                            self.command_options[cmd] = []
+                        if cmd not in self.app._command_classes:
+                            command_names.append(cmd)
+                    self._command_trie = _build_trie(command_names)
+                
+                def _init_options(self, cmd_name):
+                    """
+                    提取指定命令的参数选项并构建前缀树。子命令的参数在运行期间不会变化，
+                    因此结果缓存在 app._completion_cache 中，只需提取一次。
+                    """
+                    trie = self.app._completion_cache.get(cmd_name)
+                    if trie is None:
+                        parser = self.app._build_parser(cmd_name)
+                        opts = []
+                        for action in parser._actions:
+                            opts.extend(action.option_strings)
+                        trie = _build_trie(opts)
+                        self.app._completion_cache[cmd_name] = trie
+                    return trie
 
                 def get_completions(self, document: Document, complete_event):
                     # 获取光标前的文本并去除左侧空白
@@ -171,27 +302,22 @@ class CLIApp:
                     
                     # 情况 1: 正在输入第一个词（命令名）
                     if ' ' not in text:
-                        for cmd in self.command_options.keys():
-                            if cmd.startswith(text):
-                                yield Completion(cmd, start_position=-len(text))
+                        for cmd in _iter_trie(self._command_trie, text):
+                            yield Completion(cmd, start_position=-len(text))
                         return
 
                     # 情况 2: 已经输入了命令，正在输入参数
                     # 获取第一个词作为命令
                     first_word = text.split()[0]
                     
-                    if first_word in self.command_options:
+                    if first_word in self.app._command_classes:
                         # 获取光标前的单词（用于匹配参数前缀）
                         word_before_cursor = document.get_word_before_cursor(WORD=True)
                         
-                        # 获取该命令的所有可用参数
-                        options = self.command_options[first_word]
-                        
                         # 简单的优化：如果已经输入了某个参数，理论上不应该再次提示它
                         # 但为了简单起见，我们这里总是提示所有匹配前缀的参数
-                        for opt in options:
-                            if opt.startswith(word_before_cursor):
-                                yield Completion(opt, start_position=-len(word_before_cursor))
+                        for opt in _iter_trie(self._init_options(first_word), word_before_cursor):
+                            yield Completion(opt, start_position=-len(word_before_cursor))
 
             # 初始化自定义补全器
             completer = CLICompleter(self)
@@ -225,19 +351,18 @@ class CLIApp:
                 
                 # 内置的全局帮助逻辑
                 if user_input.lower() in ('help', '?'):
-                    self.parser.print_help()
+                    # 帮助文本只在注册的命令变化后才需要重新生成
+                    if self._cached_help is None:
+                        self._add_all_subparsers()
+                        self._cached_help = self.parser.format_help()
+                    sys.stdout.write(self._cached_help)
                     continue
 
-                # 使用 shlex.split 模拟 shell 的参数分割规则，支持引号包含的参数
-                # 在 Windows 上 shlex 默认按 POSIX 规则处理（反斜杠是转义符），导致路径 E:\path 被错误解析
-                # 因此需指定 posix=False 以支持 Windows 风格路径（反斜杠仅作为分隔符）
-                # 注意：posix=False 会保留引号，所以我们需要手动处理引号去除
-                is_windows = sys.platform.startswith('win')
-                argv = shlex.split(user_input, posix=not is_windows)
+                argv = _split_input(user_input)
                 
-                # 如果是 Windows 模式，shlex 不会自动去除引号，我们需要手动去除
-                if is_windows:
-                    argv = [arg.strip('"\'') for arg in argv]
+                # 两条命令之间 config.json 可能被修改：重新获取配置
+                # （load_config 以文件的修改时间和大小为缓存键，文件未变化时只需一次 stat）
+                self.refresh_config()
                 
                 try:
                     # 在当前进程中执行解析和运行逻辑
@@ -281,6 +406,14 @@ class CLIApp:
             return self.run_interactive()
 
         try:
+            # 只构建实际调用的子命令的解析器；
+            # 无法确定子命令时（如顶层 --help 或未知命令），仅添加名称和描述
+            name = self._sniff_subcommand(argv)
+            if name is None:
+                self._add_all_subparsers()
+            else:
+                self._build_parser(name)
+
             # 解析参数
             args = self.parser.parse_args(argv)
             if not args.command:
@@ -292,8 +425,12 @@ class CLIApp:
             return command.execute(args)
             
         except ArgumentParserError as e:
+            # --help 等正常退出：帮助信息已经输出，直接返回 0
+            if e.status == 0:
+                return 0
             # 在非交互模式下，如果是解析错误，返回 1
-            msg = translate_error(str(e))
+            from toolboxs import translate_error
+            msg = translate_error(str(e), self.config)
             print(f"用法错误: {msg}", file=sys.stderr)
             return 1
         except Exception as e:
@@ -4,18 +4,16 @@ CLI 主入口点和命令自动加载模块。
 """
 
 import sys
-import pkgutil
-import importlib
-import inspect
-import json
 from types import ModuleType
-from typing import Iterator
+from typing import Iterator, Optional
 from pathlib import Path
 from src.cli.core import CLIApp, BaseCommand
 import src.cli.commands
-from toolboxs import get_library_path
 
-def load_commands(app: CLIApp) -> None:
+# 程序名称，显示在提示符和帮助信息中
+PROG_NAME = "passersbyc"
+
+def load_commands(app: CLIApp, command: Optional[str] = None) -> None:
     """
     从 commands 包中动态加载所有命令。
     此函数遍历 src.cli.commands 包中的所有模块，
@@ -23,37 +21,60 @@ def load_commands(app: CLIApp) -> None:
     
     Args:
         app: CLIApp 实例，用于注册发现的命令。
+        command: 本次要执行的子命令名称（可选）。指定时先只导入同名模块
+                 src.cli.commands.<command>，若其中注册了该命令则不再扫描其他模块；
+                 否则回退到完整扫描。
     """
+    import importlib
     
-    # 遍历 src.cli.commands 包中的所有模块
     package = src.cli.commands
     prefix = package.__name__ + "."
+    loaded = None
     
-    for _, name, _ in pkgutil.iter_modules(package.__path__, prefix):
+    # 快速路径：命令模块通常与命令同名（如 greet 命令位于 greet.py）
+    if command is not None and command.isidentifier():
+        loaded = prefix + command
         try:
-            # 动态导入模块
-            module = importlib.import_module(name)
-            # 在模块中查找并注册命令类
-            _register_commands_from_module(app, module)
-        except ImportError as e:
-            # 如果模块导入失败，打印警告但不中断程序
-            print(f"Warning: Failed to load command module '{name}': {e}", file=sys.stderr)
+            _register_commands_from_module(app, importlib.import_module(loaded))
+        except ImportError:
+            pass
+        if command in app._command_classes:
+            return
+    
+    import pkgutil
+    # 遍历 src.cli.commands 包中的所有模块
+    # 每个路径只取一次 sys.path_importer_cache 中缓存的查找器，直接用它列出模块
+    for path in package.__path__:
+        finder = pkgutil.get_importer(path)
+        for name, _ in pkgutil.iter_importer_modules(finder, prefix):
+            if name == loaded:
+                continue
+            try:
+                # 动态导入模块（已导入过的模块直接从 sys.modules 返回）
+                module = importlib.import_module(name)
+                # 在模块中查找并注册命令类
+                _register_commands_from_module(app, module)
+            except ImportError as e:
+                # 如果模块导入失败，打印警告但不中断程序
+                print(f"Warning: Failed to load command module '{name}': {e}", file=sys.stderr)
 
 def _register_commands_from_module(app: CLIApp, module: ModuleType) -> None:
     """
     在指定模块中查找并注册 BaseCommand 的子类。
-    此函数使用反射来检查模块中的所有成员，
-    找到继承自 BaseCommand 的类并将其注册到应用中。
+    此函数直接遍历模块的命名空间字典，
+    找到在该模块中定义的 BaseCommand 子类并将其注册到应用中。
     
     Args:
         app: CLIApp 实例。
         module: 要扫描的 Python 模块对象。
     """
-    for name, obj in inspect.getmembers(module):
-        # 检查对象是否为 BaseCommand 的子类（排除 BaseCommand 自身）
-        if (inspect.isclass(obj) and 
+    for name, obj in vars(module).items():
+        # 检查对象是否为 BaseCommand 的子类（排除 BaseCommand 自身），
+        # 并且定义在该模块中（跳过通过 from x import FooCommand 导入的类）
+        if (isinstance(obj, type) and 
             issubclass(obj, BaseCommand) and 
-            obj is not BaseCommand):
+            obj is not BaseCommand and
+            obj.__module__ == module.__name__):
             try:
                 # 注册命令类
                 app.register_command(obj)
@@ -69,10 +90,25 @@ def main() -> int:
     Returns:
         应用执行的退出码。
     """
+    argv = sys.argv[1:]
+    from src.cli._manifest import load_from_manifest, read_help
+    # 快速路径：顶层帮助直接输出命令清单中缓存的帮助文本，无需加载任何命令
+    if argv and argv[0] in ("-h", "--help"):
+        help_text = read_help()
+        if help_text is not None:
+            sys.stdout.write(help_text)
+            return 0
+
     # 创建 CLI 应用实例，设置程序名为 'passersbyc'
-    app = CLIApp(prog_name="passersbyc")
-    # 动态加载所有命令
-    load_commands(app)
+    app = CLIApp(prog_name=PROG_NAME)
+    # 动态加载命令：只要能从参数中确定子命令，就只加载该命令所在的模块
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    # 优先根据命令清单（由 build_manifest 命令生成）只导入该命令的模块
+    if command is None or not load_from_manifest(app, command):
+        load_commands(app, command)
+    # 启动时读取一次 config.json，由各命令通过 self.config 共享
+    app.refresh_config()
+    from toolboxs import get_library_path
     # 启动应用
     library_path = get_library_path()
     # 确保库目录存在
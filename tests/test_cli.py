@@ -1,6 +1,9 @@
 import unittest
 import sys
 import os
+import csv
+import shutil
+import tempfile
 from pathlib import Path
 from io import StringIO
 from unittest.mock import patch
@@ -12,9 +15,15 @@ from src.cli.core import CLIApp, BaseCommand
 from src.cli.main import load_commands
 
 class TestCLI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 命令扫描每个测试类只执行一次，各测试共用同一个 CLIApp
+        cls.app = CLIApp()
+        load_commands(cls.app)
+
     def setUp(self):
-        self.app = CLIApp()
-        load_commands(self.app)
+        self.app = self.__class__.app
+
     def test_import_command(self):
         """
         测试 import 命令的完整参数解析、文件复制和元数据生成逻辑。
@@ -71,6 +80,153 @@ class TestCLI(unittest.TestCase):
             # 注意：由于文件类型依赖于 config.json 的配置，
             # 为了保证测试的健壮性，这里不强行断言具体的文件类型。
 
+    def _run_import_in(self, root, files):
+        """
+        以 root 作为项目根目录（书库、清单都写在其中）执行 import 命令。
+        :return: (退出码, 控制台输出)
+        """
+        config = {
+            "filetype": {"txt": "novel"},
+            "project_settings": {"library_path": "library", "csv_path": "library_manifest.csv"},
+        }
+        with patch('toolboxs.get_project_root', return_value=root), \
+             patch('toolboxs.get_library_path', return_value=root / "library"), \
+             patch.object(self.app, 'config', config), \
+             patch('sys.stdout', new=StringIO()) as fake_out:
+            exit_code = self.app.run(['import'] + [str(f) for f in files])
+        return exit_code, fake_out.getvalue()
+
+    def test_import_multiple_files_in_batch_duplicates(self):
+        """
+        测试一次导入多个文件：同一批次中内容相同的文件只导入一个，
+        且导入失败的文件不会导致其他同内容文件被当作重复跳过。
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            src = root / "src"
+            src.mkdir()
+            for name, content in [("x.bin", "same"), ("x.txt", "same"), ("y.txt", "same"), ("z.txt", "other")]:
+                (src / name).write_text(content, encoding="utf-8")
+
+            exit_code, output = self._run_import_in(
+                root, [src / "x.bin", src / "x.txt", src / "y.txt", src / "z.txt"])
+
+            # x.bin 无法识别类型而失败，但不影响同内容的 x.txt / y.txt 中的一个被导入
+            self.assertEqual(exit_code, 1)
+            self.assertIn("无法识别文件类型", output)
+            self.assertEqual(output.count("⚠️  文件已存在 (MD5 命中)"), 1)
+            imported = sorted(p.name for p in (root / "library" / "novel").iterdir())
+            self.assertEqual(len(imported), 2)
+            self.assertIn("z.txt", imported)
+            self.assertIn(imported[0], ("x.txt", "y.txt"))
+
+            # 清单中每个导入的文件恰好一行
+            with open(root / "library_manifest.csv", encoding="utf-8-sig", newline="") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(sorted(row[0] for row in rows[1:]), imported)
+
+    def test_import_batch_same_name_different_content(self):
+        """
+        测试同一批次中同名但内容不同的文件：只导入其中一个，另一个因目标路径冲突而失败，
+        不会同时写入同一个目标文件。
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for sub, content in [("a", "aaa"), ("b", "bbbbbb")]:
+                (root / sub).mkdir()
+                (root / sub / "book.txt").write_text(content, encoding="utf-8")
+
+            exit_code, output = self._run_import_in(root, [root / "a" / "book.txt", root / "b" / "book.txt"])
+
+            self.assertEqual(exit_code, 1)
+            self.assertIn("与本批次中的其他文件冲突", output)
+            imported = root / "library" / "novel" / "book.txt"
+            self.assertIn(imported.read_text(encoding="utf-8"), ("aaa", "bbbbbb"))
+            with open(root / "library_manifest.csv", encoding="utf-8-sig", newline="") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[1][0], "book.txt")
+
+    def test_import_batch_duplicate_after_copy_failure(self):
+        """
+        测试同一批次中先登记的文件复制失败时，同内容的另一个文件仍会被导入。
+        """
+        real_copy2 = shutil.copy2
+
+        def failing_copy2(source, target, *args, **kwargs):
+            if Path(source).name == "a.txt":
+                raise OSError("模拟复制失败")
+            return real_copy2(source, target, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            src = root / "src"
+            src.mkdir()
+            (src / "a.txt").write_text("same", encoding="utf-8")
+            (src / "b.txt").write_text("same", encoding="utf-8")
+
+            with patch('shutil.copy2', side_effect=failing_copy2):
+                self._run_import_in(root, [src / "a.txt", src / "b.txt"])
+
+            imported = [p.name for p in (root / "library" / "novel").iterdir()]
+            self.assertEqual(imported, ["b.txt"])
+
+    def test_clean_removes_cache_files(self):
+        """
+        测试 clean 命令：删除缓存文件和 __pycache__ 目录，保留其他文件。
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "pkg" / "__pycache__").mkdir(parents=True)
+            (root / "pkg" / "__pycache__" / "mod.cpython-312.pyc").write_bytes(b"")
+            (root / "pkg" / "mod.py").write_text("", encoding="utf-8")
+            (root / "pkg" / "old.pyc").write_bytes(b"")
+            (root / ".DS_Store").write_bytes(b"")
+
+            with patch('sys.stdout', new=StringIO()) as fake_out:
+                exit_code = self.app.run(['clean', '-v', '-q', tmp])
+
+            self.assertEqual(exit_code, 0)
+            self.assertFalse((root / "pkg" / "__pycache__").exists())
+            self.assertFalse((root / "pkg" / "old.pyc").exists())
+            self.assertFalse((root / ".DS_Store").exists())
+            self.assertTrue((root / "pkg" / "mod.py").exists())
+            self.assertIn("已清理 3 个缓存文件/目录", fake_out.getvalue())
+
+    def test_clean_nonexistent_path(self):
+        """
+        测试 clean 命令：路径不存在时正常退出，提示没有缓存文件。
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            missing = os.path.join(tmp, "missing")
+            with patch('sys.stdout', new=StringIO()) as fake_out:
+                exit_code = self.app.run(['clean', '-q', missing])
+
+            self.assertEqual(exit_code, 0)
+            self.assertIn("没有发现缓存文件", fake_out.getvalue())
+
+    def test_help_exit_code(self):
+        """
+        测试 --help / -h 返回 0，而错误的选项仍返回 1。
+        """
+        with patch('sys.stdout', new=StringIO()) as fake_out, patch('sys.stderr', new=StringIO()):
+            self.assertEqual(self.app.run(['--help']), 0)
+            self.assertEqual(self.app.run(['import', '-h']), 0)
+        self.assertIn("usage", fake_out.getvalue())
+
+        with patch('sys.stdout', new=StringIO()), patch('sys.stderr', new=StringIO()):
+            self.assertEqual(self.app.run(['import', '--bogus']), 1)
+
+    def test_split_input(self):
+        """
+        测试交互模式的参数分割：带引号的路径、普通路径以及含全角空格的路径。
+        """
+        from src.cli.core import _split_input
+        self.assertEqual(_split_input('import "my book.txt" -a 作者'), ['import', 'my book.txt', '-a', '作者'])
+        self.assertEqual(_split_input('import  books/a.txt\tbooks/b.txt'), ['import', 'books/a.txt', 'books/b.txt'])
+        # 全角空格和不换行空格属于文件名的一部分，不能作为分隔符
+        self.assertEqual(_split_input('import 我的\u3000书.txt a\u00a0b.txt'), ['import', '我的\u3000书.txt', 'a\u00a0b.txt'])
+
 """
     def test_greet_command(self):
         with patch('sys.stdout', new=StringIO()) as fake_out:
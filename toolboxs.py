@@ -1,15 +1,19 @@
 import json
 import sys
+import functools
 import hashlib
 import csv
 import re
 import unicodedata
+import os
 from pathlib import Path
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     动态获取项目根目录。
     无论从哪个脚本调用，都能准确找到 config.json 所在的根目录。
+    项目根目录在进程运行期间不会变化，结果只计算一次。
     """
     # __file__ 是当前文件 (toolboxs.py) 的路径
     # 因为 toolboxs.py 就在根目录下，所以它的 parent 就是根目录
@@ -19,92 +23,202 @@ def get_library_path() -> Path:
     """
     获取书库存储路径。
     优先读取 config.json 中的配置，若无配置则默认返回项目根目录下的 'library' 文件夹。
+    结果不在进程内缓存，交互模式下修改 library_path 后立即生效：
+    load_config 以配置文件的修改时间和大小为缓存键，文件未变化时只需一次 stat。
+    本函数不会创建目录，目录由 main() 在启动时统一创建。
     """
     root = get_project_root()
-    config_path = root / "config.json"
     
-    if config_path.exists():
-        try:
-            config = json.loads(config_path.read_text(encoding="utf-8"))
-            # 尝试从 project_settings -> library_path 读取
-            path_str = config.get("project_settings", {}).get("library_path")
-            if path_str:
-                path = Path(path_str)
-                # 如果是相对路径，则相对于项目根目录解析
-                return path if path.is_absolute() else (root / path).absolute()
-        except Exception:
-            pass
+    try:
+        # 与其他辅助函数共用 load_config 的缓存（以字节读取后直接解析）；配置文件不存在时为空字典
+        config = load_config()
+        # 尝试从 project_settings -> library_path 读取
+        path_str = config.get("project_settings", {}).get("library_path")
+        if path_str:
+            path = Path(path_str)
+            # 如果是相对路径，则相对于项目根目录解析
+            return path if path.is_absolute() else (root / path).absolute()
+    except Exception:
+        pass
     
     # 默认兜底方案：根目录下的 library 文件夹
-    default_path = root / "library"
-    default_path.mkdir(exist_ok=True)
-    return default_path
+    return root / "library"
+
+# config.json 的解析缓存：路径 -> ((st_mtime_ns, st_size), 配置字典, (翻译正则, 翻译字典))
+_CONFIG_CACHE = {}
+
+def _compile_translations(translations: dict) -> tuple:
+    """
+    将翻译字典编译为一个由所有原文组成的替换正则。
+    原文按长度从长到短排列，避免较短的原文抢先匹配较长原文的一部分。
+    :return: (正则, 翻译字典)；没有翻译项时正则为 None。
+    """
+    if not translations:
+        return None, translations
+    pattern = re.compile("|".join(map(re.escape, sorted(translations, key=len, reverse=True))))
+    return pattern, translations
+
+def _config_entry() -> tuple:
+    """
+    获取 config.json 的缓存项：(配置字典, (翻译正则, 翻译字典))。
+    以文件的 (修改时间, 大小) 作为缓存键，文件未变化时直接返回缓存，只需一次 stat 调用。
+    配置文件不存在时返回空配置；解析失败时抛出异常，由调用方处理。
+    """
+    config_path = get_project_root() / "config.json"
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {}, (None, {})
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(str(config_path))
+    if cached is None or cached[0] != key:
+        config = json.loads(config_path.read_bytes())
+        translations = _compile_translations(config.get("translations", {}))
+        cached = (key, config, translations)
+        _CONFIG_CACHE[str(config_path)] = cached
+    return cached[1], cached[2]
+
+def load_config() -> dict:
+    """
+    读取项目根目录下的 config.json（带缓存，见 _config_entry）。
+    返回的字典在多次调用之间共享，调用方不应修改它。
+    """
+    return _config_entry()[0]
+
+def _translations_for(config: dict) -> tuple:
+    """
+    获取 config 对应的 (翻译正则, 翻译字典)。
+    config 就是 load_config() 缓存的字典时直接复用已编译的正则，否则现场编译。
+    """
+    for _, cached_config, translations in _CONFIG_CACHE.values():
+        if cached_config is config:
+            return translations
+    return _compile_translations(config.get("translations", {}))
 
-def translate_error(message: str) -> str:
+def translate_error(message: str, config: dict = None) -> str:
     """
     将 argparse 的英文错误信息翻译为中文。
     从 config.json 读取翻译配置。
+    :param message: 英文错误信息
+    :param config: 已读取的配置字典，默认调用 load_config() 获取
     """
-    translations = {}
-    config_path = Path.cwd() / "config.json"
-    
-    if config_path.exists():
-        try:
-            config = json.loads(config_path.read_text(encoding="utf-8"))
-            translations = config.get("translations", {})
-        except Exception as e:
-            print(f"警告: 无法读取配置文件 {config_path}: {e}", file=sys.stderr)
+    pattern, translations = None, {}
+    try:
+        if config is None:
+            pattern, translations = _config_entry()[1]
+        else:
+            pattern, translations = _translations_for(config)
+    except Exception as e:
+        print(f"警告: 无法读取配置文件 {get_project_root() / 'config.json'}: {e}", file=sys.stderr)
 
-    translated = message
-    for eng, chn in translations.items():
-        translated = translated.replace(eng, chn)
-    return translated
+    if pattern is None:
+        return message
+    # 一次扫描完成所有替换，而不是对每个翻译项各扫描一遍
+    return pattern.sub(lambda m: translations[m.group(0)], message)
 
-def determine_file_type(file_path: str) -> str:
+def determine_file_type(file_path: str, config: dict = None) -> str:
     """
     根据文件扩展名确定文件类型。
     从 config.json 读取文件类型映射配置。
     :param file_path: 文件路径
+    :param config: 已读取的配置字典，默认调用 load_config() 获取
     """
-    path_obj = Path(file_path)
-    ext = path_obj.suffix.lower()
+    # 只需要扩展名，直接在字符串上切分，无需构造 Path 对象；
+    # os.path.splitext 与 Path.suffix 一样会忽略 ".bashrc" 这类以点开头的文件名
+    ext = os.path.splitext(file_path)[1]
     
-    if ext:
-        ext_key = ext[1:]  # 去掉点号，例如 ".txt" -> "txt"
+    if len(ext) > 1:
+        ext_key = ext[1:].lower()  # 去掉点号，例如 ".txt" -> "txt"
     else:
         return "unknown"
     
     filetype_mapping = {}
-    config_path = Path.cwd() / "config.json"
-    
-    if config_path.exists():
-        try:
-            config = json.loads(config_path.read_text(encoding="utf-8"))
-            filetype_mapping = config.get("filetype", {})
-        except Exception as e:
-            print(f"警告: 无法读取配置文件 {config_path}: {e}", file=sys.stderr)
+    try:
+        if config is None:
+            config = load_config()
+        filetype_mapping = config.get("filetype", {})
+    except Exception as e:
+        print(f"警告: 无法读取配置文件 {get_project_root() / 'config.json'}: {e}", file=sys.stderr)
     
     return filetype_mapping.get(ext_key, "unknown")
 
-def generate_file_md5(file_path: Path, chunk_size: int = 8192) -> str:
+# 支持的文件指纹算法。blake2b 截断为 16 字节，输出与 MD5 一样是 32 位十六进制字符串，
+# 在没有 MD5 硬件加速的 CPU 上通常比 MD5 更快
+_HASH_FACTORIES = {
+    "md5": hashlib.md5,
+    "blake2b": functools.partial(hashlib.blake2b, digest_size=16),
+    "sha256": hashlib.sha256,
+}
+
+# 回退路径下每次读取的默认块大小（1MB）
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+def _file_digest(file_path, algorithm: str, chunk_size: int = _DIGEST_CHUNK_SIZE) -> str:
     """
-    生成文件的 MD5 哈希值。
+    计算文件的哈希值，失败时抛出异常（由 generate_file_digest 处理）。
+    """
+    factory = _HASH_FACTORIES[algorithm]
+    with open(file_path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, factory).hexdigest()
+        file_hash = factory()
+        # 循环读入同一块预分配的缓冲区并更新哈希对象，避免每块都分配新的 bytes
+        buffer = memoryview(bytearray(chunk_size))
+        while n := f.readinto(buffer):
+            file_hash.update(buffer[:n])
+        return file_hash.hexdigest()
+
+@functools.lru_cache(maxsize=1024)
+def _cached_file_digest(path_str: str, algorithm: str, size: int, mtime_ns: int) -> str:
+    """
+    带缓存的 _file_digest：以 (路径, 算法, 文件大小, 修改时间) 作为缓存键，
+    文件未被修改时再次计算直接返回缓存结果。计算失败时抛出异常，不会被缓存。
+    块大小不影响哈希值，因此不参与缓存键，始终使用默认块大小。
+    """
+    return _file_digest(path_str, algorithm)
+
+def generate_file_digest(file_path: Path, algorithm: str = "md5", chunk_size: int = _DIGEST_CHUNK_SIZE) -> str:
+    """
+    生成文件的哈希值。
     使用流式读取，即使是大文件也不会占用过多内存。
+    Python 3.11+ 使用 hashlib.file_digest，读取与计算都在 C 层完成；
+    旧版本回退到按块读入预分配的缓冲区；文件以无缓冲方式打开，避免数据经过额外的缓冲区拷贝。
+    同一进程内对大小和修改时间均未变化的文件重复计算时，直接返回缓存的结果。
     :param file_path: 文件路径
-    :param chunk_size: 每次读取的块大小（默认 8KB）
-    :return: 32位 MD5 字符串
+    :param algorithm: 哈希算法，可选 "md5"（默认）、"blake2b"、"sha256"
+    :param chunk_size: 回退路径下每次读取的块大小（默认 1MB）；指定其他大小时不使用缓存
+    :return: 十六进制哈希字符串；计算失败时返回空字符串
+    :raises ValueError: algorithm 不是支持的算法
     """
-    md5_hash = hashlib.md5()
+    if algorithm not in _HASH_FACTORIES:
+        raise ValueError(f"unsupported hash algorithm: {algorithm!r}; expected one of {sorted(_HASH_FACTORIES)}")
     try:
-        with open(file_path, "rb") as f:
-            # 循环读取文件内容并更新哈希对象
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+        if chunk_size != _DIGEST_CHUNK_SIZE:
+            return _file_digest(file_path, algorithm, chunk_size)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            # 无法获取文件信息时不使用缓存，由 open 报告具体错误
+            return _file_digest(file_path, algorithm)
+        return _cached_file_digest(os.path.abspath(file_path), algorithm, st.st_size, st.st_mtime_ns)
     except Exception as e:
-        print(f"错误: 无法计算文件 MD5 {file_path}: {e}", file=sys.stderr)
+        print(f"错误: 无法计算文件 {algorithm.upper()} {file_path}: {e}", file=sys.stderr)
         return ""
 
+def generate_file_md5(file_path: Path, chunk_size: int = _DIGEST_CHUNK_SIZE) -> str:
+    """
+    生成文件的 MD5 哈希值。
+    书库清单的 MD5 列和查重逻辑依赖此函数，因此保持使用 MD5。
+    :param file_path: 文件路径
+    :param chunk_size: 回退路径下每次读取的块大小（默认 1MB）
+    :return: 32位 MD5 字符串
+    """
+    return generate_file_digest(file_path, "md5", chunk_size)
+
+# Windows 文件名中的非法字符：用于切分原始文件名，以及替换规范化后产生的非法字符
+_ILLEGAL_SPLIT = re.compile(r'([<>:"/\\|?*])')
+_ILLEGAL_TABLE = dict.fromkeys(map(ord, '<>:"/\\|?*'), "_")
+
 def clean_filename(filename: str, replace_char: str = "_") -> str:
     """
     清洗文件名。
@@ -120,42 +234,103 @@ def clean_filename(filename: str, replace_char: str = "_") -> str:
     if not filename:
         return ""
 
-    illegal_chars = set('<>:"/\\|?*')
-    result = []
-    
-    for char in filename:
-        # 如果原本就是半角非法字符，直接保留
-        if char in illegal_chars:
-            result.append(char)
-            continue
-            
-        # 否则尝试规范化
-        normalized = unicodedata.normalize('NFKC', char)
-        
-        # 检查规范化后的字符是否包含非法字符
-        clean_segment = ""
-        for n_char in normalized:
-            if n_char in illegal_chars:
-                clean_segment += replace_char
-            else:
-                clean_segment += n_char
-        
-        result.append(clean_segment)
-
-    cleaned = "".join(result)
+    # 按原始的半角非法字符切分（保留分隔符），奇数下标即这些非法字符本身，原样保留；
+    # 其余片段整体规范化后，用一次 translate 替换规范化产生的非法字符
+    table = _ILLEGAL_TABLE if replace_char == "_" else dict.fromkeys(_ILLEGAL_TABLE, replace_char)
+    parts = _ILLEGAL_SPLIT.split(filename)
+    cleaned = "".join(
+        part if i % 2 else unicodedata.normalize('NFKC', part).translate(table)
+        for i, part in enumerate(parts)
+    )
 
     # 去除不可见字符 (如控制符) 和首尾空格
-    cleaned = "".join(ch for ch in cleaned if ch.isprintable())
+    # 绝大多数文件名全部可打印：先用 str.isprintable 在 C 层一次检查整个字符串，
+    # 只有确实含有不可见字符时才逐字符过滤
+    if not cleaned.isprintable():
+        cleaned = "".join(ch for ch in cleaned if ch.isprintable())
     return cleaned.strip()
 
-def export_library_manifest(output_csv_path: str = None) -> str:
+def _iter_json_files(top: str):
+    """
+    递归产出 top 目录下所有 .json 普通文件的路径（不跟随符号链接）。
+    使用显式栈和 os.scandir 遍历，不为每个目录项创建 Path 对象；
+    目录项类型来自 scandir 已读取的信息，通常无需额外的 stat 调用。
+    """
+    stack = [top]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+# 清单的 CSV 表头，以及每一列对应的元数据字段和缺省值（tags 列由 manifest_row 单独转换为字符串）
+MANIFEST_HEADERS = (
+    "文件名", "作者", "系列", "标签", "来源",
+    "后缀", "分类", "导入时间", "文件大小(Bytes)", "MD5", "文件路径",
+)
+_FIELD_KEYS = (
+    "original_filename", "author", "series", "tags", "source",
+    "file_type", "type", "import_time", "file_size", "md5", "file_path",
+)
+_FIELD_DEFAULTS = ("", "", "", [], "", "", "", "", 0, "", "")
+
+@functools.lru_cache(maxsize=1)
+def _json_loads():
+    """
+    获取解析元数据使用的 JSON 解析函数。
+    orjson 为可选依赖：已安装时使用其更快的 C 实现，否则回退到标准库 json。
+    首次解析元数据时才导入，不影响其他命令的启动时间。
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
+    return loads
+
+def manifest_row(meta: dict) -> list:
+    """
+    将一条元数据转换为清单中的一行，列顺序与 MANIFEST_HEADERS 一致。
+    导出清单和导入时追加清单都使用此函数，保证两者的行格式一致。
+    :param meta: 元数据字典
+    :return: 行数据列表
+    """
+    # map 同时遍历字段名和缺省值，逐个调用 meta.get(字段名, 缺省值)
+    row = list(map(meta.get, _FIELD_KEYS, _FIELD_DEFAULTS))
+    # 处理标签列表，转为逗号分隔的字符串（常见情况下 tags 就是 list，比 isinstance 更快）
+    tags = row[3]
+    row[3] = ",".join(tags) if tags.__class__ is list else str(tags)
+    return row
+
+def _parse_meta(json_file: str):
+    """
+    读取单个元数据文件并转换为清单中的一行。
+    :param json_file: 元数据 JSON 文件路径
+    :return: 行数据列表；空文件返回 None；文件无法处理时打印警告并返回 None
+    """
+    try:
+        with open(json_file, 'rb') as f:
+            data = f.read()
+        # 空文件（例如写入中途被中断）直接跳过
+        if not data:
+            return None
+        return manifest_row(_json_loads()(data))
+    except Exception as e:
+        print(f"警告: 无法处理元数据文件 {json_file}: {e}", file=sys.stderr)
+        return None
+
+def export_library_manifest(output_csv_path: str = None, config: dict = None) -> str:
     """
     导出书库清单：递归扫描 library/.meta 目录下的所有 JSON 文件，并汇总生成一个 CSV 文件。
     :param output_csv_path: 输出的 CSV 文件路径
+    :param config: 已读取的配置字典，默认调用 load_config() 获取
     :return: 生成的 CSV 文件的绝对路径
     """
     if output_csv_path is None:
-        output_csv_path = config["project_settings"]["csv_path"]
+        if config is None:
+            config = load_config()
+        output_csv_path = config.get("project_settings", {}).get("csv_path", "library_manifest.csv")
     
     root = get_project_root()
     meta_dir = root / "library" / ".meta"
@@ -164,47 +339,21 @@ def export_library_manifest(output_csv_path: str = None) -> str:
     if not meta_dir.exists():
         return f"错误: 目录 {meta_dir} 不存在"
 
-    # 定义 CSV 表头
-    headers = [
-        "文件名", "作者", "系列", "标签", "来源", 
-        "后缀", "分类", "导入时间", "文件大小(Bytes)", "MD5","文件路径"
-    ]
-    
-    data_rows = []
-    
-    # 递归查找所有 .json 文件
-    for json_file in meta_dir.rglob("*.json"):
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
-                
-                # 处理标签列表，转为逗号分隔的字符串
-                tags = meta.get("tags", [])
-                tags_str = ",".join(tags) if isinstance(tags, list) else str(tags)
-                
-                row = [
-                    meta.get("original_filename", ""),
-                    meta.get("author", ""),
-                    meta.get("series", ""),
-                    tags_str,
-                    meta.get("source", ""),
-                    meta.get("file_type", ""),
-                    meta.get("type", ""),
-                    meta.get("import_time", ""),
-                    meta.get("file_size", 0),
-                    meta.get("md5", ""),  # 获取 MD5 字段
-                    meta.get("file_path", "")  # 获取 文件路径 字段
-                ]
-                data_rows.append(row)
-        except Exception as e:
-            print(f"警告: 无法处理元数据文件 {json_file}: {e}", file=sys.stderr)
+    # 元数据文件很小，耗时主要在打开和读取文件上，使用线程池并发读取
+    # ex.map 按输入顺序返回结果，CSV 行的顺序与遍历顺序一致；
+    # 结果以生成器的形式直接交给 writer.writerows，不在内存中汇总成列表
+    paths = list(_iter_json_files(os.fspath(meta_dir)))
+
+    # 线程池只在导出清单时才需要，延迟导入以免拖慢每次启动（concurrent.futures 会连带导入 logging）
+    from concurrent.futures import ThreadPoolExecutor
 
     # 写入 CSV 文件
     try:
-        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex, \
+                open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(data_rows)
+            writer.writerow(MANIFEST_HEADERS)
+            writer.writerows(row for row in ex.map(_parse_meta, paths) if row is not None)
         return str(output_path.absolute())
     except Exception as e:
         return f"错误: 无法写入 CSV 文件: {e}"
\ No newline at end of file